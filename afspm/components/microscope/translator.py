@@ -382,14 +382,25 @@ class MicroscopeTranslator(afspmc.AfspmComponentBase, metaclass=ABCMeta):
         self._handle_polling_device()
 
 
-def get_file_modification_datetime(filename: str) -> datetime.datetime:
+def get_file_modification_datetime(filename: str,
+                                   stat_result: os.stat_result = None
+                                   ) -> datetime.datetime:
     """Read modification time of a file, return a datetime representing it.
 
     Taken from: https://stackoverflow.com/questions/237079/how-do-i-get-file-
     creation-and-modification-date-times.
+
+    Args:
+        filename: path to the file.
+        stat_result: os.stat() result for filename, if the caller already has
+            one. If provided, we use it rather than stat-ing the file again.
+
+    Returns:
+        The file's modification time, as a UTC datetime.
     """
-    return datetime.datetime.fromtimestamp(os.path.getmtime(filename),
-                                           tz=datetime.timezone.utc)
+    mtime = (stat_result.st_mtime if stat_result is not None
+             else os.path.getmtime(filename))
+    return datetime.datetime.fromtimestamp(mtime, tz=datetime.timezone.utc)
 
 
 # Description of method for MicroscopeTranslator.param_method_map).
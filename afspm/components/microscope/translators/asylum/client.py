@@ -17,15 +17,26 @@ class XopClient:
 
     The XopClient will create a zmq connection with the asylum controller via
     a zmq interface. Afterward, any desired requests can be sent and responses
-    parsed via send_request.
+    parsed via send_request (or send_request_batch, for multiple requests).
+
+    We use a DEALER socket rather than a REQ socket, so that we may send
+    multiple requests before receiving their responses (the zmq-xop server is
+    a ROUTER, so it supports both). Responses are matched to their requests
+    via their message ids.
 
     Attributes:
         _url: address of server we are connecting to.
         _timeout_ms: how long to wait before concluding a sent request has not
             been responded to. Defaults to REQUEST_TIMEOUT_MS.
         _client: zmq socket used to connect to server.
+        _poller: zmq poller, registered once with _client, used to wait on
+            responses without busy-waiting.
     """
 
+    # A DEALER socket must explicitly send the empty delimiter frame that a
+    # REQ socket would send for us.
+    DELIMITER_FRAME = b''
+
     def __init__(self, url: str, timeout_ms: int = REQUEST_TIMEOUT_MS,
                  ctx: zmq.Context = None):
         if not ctx:
@@ -33,9 +44,12 @@ class XopClient:
         self._url = url
         self._timeout_ms = timeout_ms
 
-        self._client = ctx.socket(zmq.REQ)
+        self._client = ctx.socket(zmq.DEALER)
         self._client.connect(self._url)
 
+        self._poller = zmq.Poller()
+        self._poller.register(self._client, zmq.POLLIN)
+
     def send_request(self, method_name: str,
                      params: Optional[tuple[float | str]] = None,
                      ) -> (bool, float | str):
@@ -62,24 +76,50 @@ class XopClient:
                 request.
             ret_val: the returned value, if applicable.
         """
-        req_msg_id, req = xop.create_call_string(method_name, params)
-        logger.trace(f'Call string to send: {req}')
-        self._client.send(req.encode())
-        ts = time.time()
+        return self.send_request_batch(((method_name, params),))[0]
+
+    def send_request_batch(self, requests: tuple[tuple[str, Optional[tuple]]]
+                           ) -> list[tuple[bool, float | str]]:
+        """Send multiple asylum requests, before waiting on their responses.
+
+        All requests are sent back-to-back, after which we collect the
+        responses (matching them via their message ids). This avoids waiting
+        a full round-trip per request.
+
+        The server handles requests one at a time, so _timeout_ms applies per
+        response: the deadline is restarted whenever one of our responses is
+        received.
+
+        Args:
+            requests: tuple of (method_name, params) tuples, where each
+                corresponds to the arguments of send_request.
+
+        Returns:
+            list of (msg_received, ret_val) tuples, one per request (in the
+            same order). See send_request for more info.
+        """
+        results = {}
+        for method_name, params in requests:
+            req_msg_id, req = xop.create_call_string(method_name, params)
+            logger.trace(f'Call string to send: {req}')
+            self._client.send_multipart([self.DELIMITER_FRAME, req.encode()])
+            results[req_msg_id] = (False, None)
+        ts = time.time()  # Restarted on every matched response
 
         # Note: we use this ugly approach because the server may be responding
         # to multiple requests (with different req_msg_ids). Thus, we may
         # receive multiple messages that are not for us!
-        # Note: HIGHLY unlikely, but why not.
-        msg_received = False
-        err_code = None
-        rep_msg_id = None
-        ret_val = None
-        while not msg_received and time.time() - ts < self._timeout_ms:
-            if self._client.poll(POLL_TIMEOUT_MS, zmq.POLLIN):
-                msg = self._client.recv(zmq.NOBLOCK).decode()
+        num_pending = len(results)
+        timeout_s = self._timeout_ms / 1000
+        while num_pending > 0 and time.time() - ts < timeout_s:
+            socks = dict(self._poller.poll(POLL_TIMEOUT_MS))
+            if self._client in socks:
+                msg = self._client.recv_multipart(zmq.NOBLOCK)[-1].decode()
                 logger.trace(f'Received response: {msg}')
                 err_code, rep_msg_id, ret_val = xop.parse_response_string(
                     msg)
-                msg_received = req_msg_id == rep_msg_id
-        return msg_received, ret_val
+                if rep_msg_id in results and not results[rep_msg_id][0]:
+                    results[rep_msg_id] = (True, ret_val)
+                    num_pending -= 1
+                    ts = time.time()
+        return list(results.values())
@@ -93,6 +93,22 @@ PARAM_STR_MAP = MappingProxyType({
 # Holds which parameters are strings instead of variables
 PARAM_IS_STR_TUPLE = (AsylumParam.IMG_PATH, AsylumParam.FORCE_PATH)
 
+
+# Pre-built (method, params) get requests for each parameter. Built once at
+# import, so we avoid choosing the method and allocating the params tuple on
+# every get call.
+GET_REQUEST_MAP = MappingProxyType({
+    param: ((AsylumMethod.GET_STRING if param in PARAM_IS_STR_TUPLE
+             else AsylumMethod.GET_VALUE), (PARAM_STR_MAP[param],))
+    for param in AsylumParam})
+
+
+# Set method to use for each parameter (the value is appended per call).
+SET_METHOD_MAP = MappingProxyType({
+    param: (AsylumMethod.SET_STRING if param in PARAM_IS_STR_TUPLE
+            else AsylumMethod.SET_VALUE)
+    for param in AsylumParam})
+
 # Lookup return indicating a variable lookup failure.
 NAN_STR = 'nan'
 
@@ -119,12 +135,18 @@ def get_param(client: XopClient, param: AsylumParam) -> float | str:
     Raises:
         ParameterError if getting the parameter fails.
     """
-    # Note: need to do a value comparison
-    get_method = (AsylumMethod.GET_STRING if param in PARAM_IS_STR_TUPLE
-                  else AsylumMethod.GET_VALUE)
+    get_method, get_params = GET_REQUEST_MAP[param]
+    received, val = client.send_request(get_method, get_params)
+    return _validate_get_response(param, received, val)
 
-    received, val = client.send_request(get_method,
-                                        (PARAM_STR_MAP[param],))
+
+def _validate_get_response(param: AsylumParam, received: bool,
+                           val: float | str | None) -> float | str:
+    """Validate the response of a get request, returning the value.
+
+    Raises:
+        ParameterError if the get request failed.
+    """
     if received and not _is_variable_lookup_failure(val):
         return val
     msg = f"Get param failed for {param}"
@@ -136,6 +158,9 @@ def get_param_list(client: XopClient, params: tuple[AsylumParam],
                    ) -> tuple[float | str]:
     """Get list of asylum parameters.
 
+    All get requests are sent in a single batch (see
+    XopClient.send_request_batch), to avoid a round-trip per parameter.
+
     Args:
         client: XopClient, used to communicate with asylum controller.
         params: list of AsylumParams.
@@ -152,7 +177,10 @@ def get_param_list(client: XopClient, params: tuple[AsylumParam],
         do not expect that the user will be able to continue without one of
         the requested parameters.
     """
-    return tuple([get_param(client, param) for param in params])
+    requests = tuple(GET_REQUEST_MAP[param] for param in params)
+    responses = client.send_request_batch(requests)
+    return tuple([_validate_get_response(param, received, val)
+                  for param, (received, val) in zip(params, responses)])
 
 
 def set_param(client: XopClient, param: AsylumParam, val: str | float,
@@ -178,10 +206,7 @@ def set_param(client: XopClient, param: AsylumParam, val: str | float,
     except units.ConversionError:
         return False
 
-    set_method = (AsylumMethod.SET_STRING if param in PARAM_IS_STR_TUPLE
-                  else AsylumMethod.SET_VALUE)
-
-    received, __ = client.send_request(set_method,
+    received, __ = client.send_request(SET_METHOD_MAP[param],
                                        (PARAM_STR_MAP[param], val))
     return received
 
@@ -209,13 +234,101 @@ def set_param_list(client: XopClient, params: tuple[AsylumParam],
     except units.ConversionError:
         return False
 
-    all_received = True
-    for val, param in zip(converted_vals, params):
-        set_method = (AsylumMethod.SET_STRING if param in PARAM_IS_STR_TUPLE
-                      else AsylumMethod.SET_VALUE)
-        received, __ = client.send_request(set_method,
-                                           (PARAM_STR_MAP[param], val))
-        all_received = all_received and received
+    return _set_converted_param_list(client, params, converted_vals)
+
+
+def set_param_list_same_units(client: XopClient, params: tuple[AsylumParam],
+                              vals: tuple[str | float],
+                              curr_unit: str = None,
+                              desired_unit: str = None) -> bool:
+    """Convert a list of values sharing the same units and set them.
+
+    Fast-path version of set_param_list, for when all values share the same
+    current and desired units. Rather than converting each value, we compute
+    a single scale factor and apply it to all values.
+
+    Note: this assumes a purely multiplicative conversion (e.g. lengths), and
+    will not work for offset units (e.g. temperatures). As with
+    units.convert(), values are cast to float only if they are converted
+    (i.e. the factor is not 1); otherwise, they are passed through as-is.
+
+    Args:
+        client: XopClient, used to communicate with the asylum controller.
+        params: list of params to set.
+        vals: tuple of values to set to.
+        curr_unit: units of provided values, as str. Default is None.
+        desired_unit: desired units of values, as str. Default is None.
+
+    Returns:
+        True if all can be set.
+    """
+    try:
+        factor = units.convert(1.0, curr_unit, desired_unit)
+    except units.ConversionError:
+        return False
+
+    if factor != 1.0:
+        vals = [float(val) * factor for val in vals]
+    return _set_converted_param_list(client, params, vals)
+
+
+def _set_converted_param_list(client: XopClient, params: tuple[AsylumParam],
+                              vals: tuple[str | float]) -> bool:
+    """Set a list of already-converted values.
+
+    All set requests are sent in a single batch (see
+    XopClient.send_request_batch). They are handled in order by the server.
+
+    Args:
+        client: XopClient, used to communicate with the asylum controller.
+        params: list of params to set.
+        vals: tuple of values to set to, in asylum units.
+
+    Returns:
+        True if all can be set.
+    """
+    responses = client.send_request_batch(_create_set_requests(params, vals))
+    return _validate_set_responses(responses)
+
+
+def get_and_set_param_list(client: XopClient, params: tuple[AsylumParam],
+                           vals: tuple[str | float]
+                           ) -> (bool, tuple[float | str]):
+    """Get a list of asylum parameters, and then set them to new values.
+
+    The gets are sent in one batch and validated before the sets are sent in
+    a second batch (see XopClient.send_request_batch). Thus, nothing is set
+    if any get fails.
+
+    Args:
+        client: XopClient, used to communicate with the asylum controller.
+        params: list of params to get and set.
+        vals: tuple of values to set to, in asylum units.
+
+    Returns:
+        (all_set, old_vals) tuple, where:
+        - all_set is True if all could be set.
+        - old_vals is a tuple of the values before setting.
+
+    Raises:
+        ParameterError if getting any of the parameters fails (in which case
+            none are set).
+    """
+    old_vals = get_param_list(client, params)
+    return _set_converted_param_list(client, params, vals), old_vals
+
+
+def _create_set_requests(params: tuple[AsylumParam],
+                         vals: tuple[str | float]
+                         ) -> tuple[tuple[str, tuple[str, str | float]]]:
+    """Create (method, params) set requests for send_request_batch."""
+    return tuple((SET_METHOD_MAP[param], (PARAM_STR_MAP[param], val))
+                 for val, param in zip(vals, params))
+
+
+def _validate_set_responses(responses: list[tuple[bool, Any]]) -> bool:
+    """Check all set requests were received, logging an error if not."""
+    all_received = all(received for received, __ in responses)
 
     if not all_received:
         logger.error("We failed at setting one of the parameters!")
@@ -1,8 +1,9 @@
 """Handles device communication with aslyum research controllers."""
 
 import os
+import time
 import logging
-import glob
+import collections
 
 from afspm.components.microscope.translator import (
     MicroscopeTranslator,
@@ -19,8 +20,6 @@ from afspm.io.protos.generated import scan_pb2
 from afspm.io.protos.generated import control_pb2
 from afspm.io.protos.generated import feedback_pb2
 
-import SciFiReaders as sr
-
 
 logger = logging.getLogger(__name__)
 
@@ -35,12 +34,34 @@ class AsylumTranslator(MicroscopeTranslator):
 
     Attributes:
         _client: XOPClient for communicating with Asylum Research exe.
-        _old_scan_path: the prior scan filepath. We use this to avoid loading
-            the same scans multiple times.
+        _old_scans: the most recently loaded scans.
+        _scan_cache: LRU cache of loaded scans, keyed by the (path, mtime,
+            size) of their scan file. We use this to avoid loading the same
+            scans multiple times, while still reloading a file that has been
+            rewritten in place.
         _old_save_state: the prior state of whether or not we were saving
             scans.
         _old_last_scan: the prior state of whether or not we were scanning 1x
             per request.
+        params_poll_period_s: minimum period between polls of the scan and
+            zctrl parameters, in seconds. This trades latency for throughput:
+            a longer period means fewer XOP requests, but changes made outside
+            of afspm (e.g. in the Asylum GUI) take longer to be noticed.
+            Changes we make ourselves (on_set_*) always trigger a re-poll.
+            The scan state is always polled, and scans are only polled when a
+            scan ends, so neither is affected. Default is 0 (poll always).
+        _last_scan_params_poll_ts: time.monotonic() of the last scan params
+            poll, or None to force the next poll.
+        _last_zctrl_params_poll_ts: time.monotonic() of the last zctrl params
+            poll, or None to force the next poll.
+        _img_dir_cache: (time.monotonic(), path) of the last image save
+            directory we requested from the controller, or None.
+        _latest_file_cache: dict mapping an image save directory to the
+            (directory mtime, latest scan path) found when we last listed it.
+        _poll_scan_params_msg: ScanParameters2d reused (cleared and refilled)
+            by each poll_scan_params call.
+        _poll_zctrl_params_msg: ZCtrlParameters reused (cleared and refilled)
+            by each poll_zctrl_params call.
     """
 
     SCAN_PARAMS = (params.AsylumParam.TL_X, params.AsylumParam.TL_Y,
@@ -48,13 +69,28 @@ class AsylumTranslator(MicroscopeTranslator):
                    params.AsylumParam.SCAN_X_RATIO,
                    params.AsylumParam.SCAN_Y_RATIO,
                    params.AsylumParam.RES_X, params.AsylumParam.RES_Y)
+    # Whether each SCAN_PARAMS entry is spatial (i.e. has physical units).
+    SCAN_PARAMS_IS_SPATIAL = (True, True, True, False, False, False, False)
+    SCAN_PARAMS_ASYLUM_UNITS = tuple(params.PHYS_UNITS if is_spatial else None
+                                     for is_spatial in SCAN_PARAMS_IS_SPATIAL)
 
     ZCTRL_PARAMS = (params.AsylumParam.CP,
                     params.AsylumParam.CI)
 
+    SAVE_PARAMS = (params.AsylumParam.SAVE_IMAGE,
+                   params.AsylumParam.LAST_SCAN)
+
     IMG_EXT = ".ibw"
 
-    def __init__(self, xop_client: XopClient, **kwargs):
+    SCAN_CACHE_SIZE = 4  # Max number of loaded scan files we keep around.
+
+    # How long we trust our cached image save directory, in seconds. It rarely
+    # changes (once per experiment, if at all), so we avoid requesting it on
+    # every scans poll.
+    IMG_DIR_CACHE_S = 60.0
+
+    def __init__(self, xop_client: XopClient,
+                 params_poll_period_s: float = 0.0, **kwargs):
         """Init things, ensure we can hook into XOP Client."""
         if xop_client is None:
             msg = "No xop client provided, cannot continue!"
@@ -62,8 +98,18 @@ class AsylumTranslator(MicroscopeTranslator):
             raise AttributeError(msg)
 
         self._client = xop_client
-        self._old_scan_path = None
+        self.params_poll_period_s = params_poll_period_s
+        self._last_scan_params_poll_ts = None
+        self._last_zctrl_params_poll_ts = None
+        self._img_dir_cache = None
+        self._latest_file_cache = {}
+
+        # Note: reusing these is safe, as MicroscopeTranslator copies the
+        # prior params before polling, and sends the new ones immediately.
+        self._poll_scan_params_msg = scan_pb2.ScanParameters2d()
+        self._poll_zctrl_params_msg = feedback_pb2.ZCtrlParameters()
         self._old_scans = []
+        self._scan_cache = collections.OrderedDict()
 
         self._old_save_state = None
         self._old_last_scan = None
@@ -89,26 +135,23 @@ class AsylumTranslator(MicroscopeTranslator):
             last_scan: whether or not we are scanning one image (2), or
                 running continuously (0).
             store_old_vals: whether or not to store the old vals in
-                self.old_save_state and old_save_mode, respectively. useful
-                for resetting later.
+                self._old_save_state and self._old_last_scan, respectively.
+                useful for resetting later.
         """
+        vals = (save_state, last_scan)
         if store_old_vals:
-            self._old_save_state = params.get_param(
-                self._client, params.AsylumParam.SAVE_IMAGE)
-            self._old_last_scan = params.get_param(
-                self._client, params.AsylumParam.LAST_SCAN)
-
-        if not params.set_param(self._client,
-                                params.AsylumParam.SAVE_IMAGE,
-                                save_state):
-            msg = f"Unable to set SaveImage to {save_state}."
-            logger.error(msg)
-            raise MicroscopeError(msg)
+            # Get the old vals, then set the new ones (nothing is set if the
+            # get fails).
+            success, old_vals = params.get_and_set_param_list(
+                self._client, self.SAVE_PARAMS, vals)
+            self._old_save_state, self._old_last_scan = old_vals
+        else:
+            success = params.set_param_list_same_units(
+                self._client, self.SAVE_PARAMS, vals)
 
-        if not params.set_param(self._client,
-                                params.AsylumParam.LAST_SCAN,
-                                last_scan):
-            msg = f"Unable to set LastScan to {last_scan}."
+        if not success:
+            msg = (f"Unable to set SaveImage to {save_state} and LastScan "
+                   f"to {last_scan}.")
             logger.error(msg)
             raise MicroscopeError(msg)
 
@@ -131,33 +174,37 @@ class AsylumTranslator(MicroscopeTranslator):
     def on_set_scan_params(self, scan_params: scan_pb2.ScanParameters2d
                            ) -> control_pb2.ControlResponse:
         """Override setting of scan params."""
-        scan_size = scan_params.spatial.roi.size.y
+        # Bind sub-messages once, rather than re-traversing for each field.
+        spatial = scan_params.spatial
+        roi = spatial.roi
+        top_left = roi.top_left
+        size = roi.size
+        shape = scan_params.data.shape
+
+        scan_size = size.y
         scan_y_ratio = 1.0
-        scan_x_ratio = scan_params.spatial.roi.size.x / scan_size
+        scan_x_ratio = size.x / scan_size
 
         attrs = self.SCAN_PARAMS
-        vals = (scan_params.spatial.roi.top_left.x,
-                scan_params.spatial.roi.top_left.y,
-                scan_size, scan_x_ratio, scan_y_ratio,
-                scan_params.data.shape.x, scan_params.data.shape.y)
-        attr_units = (scan_params.spatial.units, scan_params.spatial.units,
-                      scan_params.spatial.units, None, None, None, None)
-        asylum_units = (params.PHYS_UNITS, params.PHYS_UNITS,
-                        params.PHYS_UNITS, None, None, None, None)
+        vals = (top_left.x, top_left.y, scan_size, scan_x_ratio,
+                scan_y_ratio, shape.x, shape.y)
+        spatial_units = spatial.units
+        attr_units = tuple(spatial_units if is_spatial else None
+                           for is_spatial in self.SCAN_PARAMS_IS_SPATIAL)
 
+        self._last_scan_params_poll_ts = None  # Force re-poll
         if params.set_param_list(self._client, attrs, vals, attr_units,
-                                 asylum_units):
+                                 self.SCAN_PARAMS_ASYLUM_UNITS):
             return control_pb2.ControlResponse.REP_SUCCESS
         return control_pb2.ControlResponse.REP_PARAM_ERROR
 
     def on_set_zctrl_params(self, zctrl_params: feedback_pb2.ZCtrlParameters
                             ) -> control_pb2.ControlResponse:
         """Override setting zctrl."""
-        desired_units = (None, None)
         attrs = self.ZCTRL_PARAMS
         vals = (zctrl_params.proportionalGain, zctrl_params.integralGain)
-        if params.set_param_list(self._client, attrs, vals, desired_units,
-                                 desired_units):
+        self._last_zctrl_params_poll_ts = None  # Force re-poll
+        if params.set_param_list_same_units(self._client, attrs, vals):
             return control_pb2.ControlResponse.REP_SUCCESS
         return control_pb2.ControlResponse.REP_PARAM_ERROR
 
@@ -173,8 +220,13 @@ class AsylumTranslator(MicroscopeTranslator):
 
     def poll_scan_params(self) -> scan_pb2.ScanParameters2d:
         """Override polling of scan params."""
+        if not self._is_poll_due(self._last_scan_params_poll_ts):
+            return self.scan_params
+        self._last_scan_params_poll_ts = time.monotonic()
+
         vals = params.get_param_list(self._client, self.SCAN_PARAMS)
-        scan_params = scan_pb2.ScanParameters2d()
+        scan_params = self._poll_scan_params_msg
+        scan_params.Clear()
         scan_params.spatial.roi.top_left.x = vals[0]
         scan_params.spatial.roi.top_left.y = vals[1]
 
@@ -195,40 +247,118 @@ class AsylumTranslator(MicroscopeTranslator):
 
     def poll_scans(self) -> [scan_pb2.Scan2d]:
         """Override polling of scans."""
-        val = params.get_param(self._client, params.AsylumParam.IMG_PATH)
-        img_path = convert_igor_path_to_python_path(val)
-        images = sorted(glob.glob(img_path + os.sep + "*" + self.IMG_EXT),
-                        key=os.path.getmtime)  # Sorted by access time
-        scan_path = images[-1] if images else None  # Get latest
-
-        if (scan_path and not self._old_scan_path or
-                scan_path != self._old_scan_path):
-            self._old_scan_path = scan_path
-            datasets = None
-            try:
-                logger.debug(f"Getting datasets from {scan_path} (each dataset"
-                             " is a channel).")
-                reader = sr.IgorIBWReader(scan_path)
-                datasets = reader.read(verbose=False)
-            except Exception as exc:
-                logger.error(f"Failure loading scan at {scan_path}: {exc}")
-                return self._old_scans
-
-            if datasets:
-                scans = []
-                ts = get_file_modification_datetime(scan_path)
-                for ds in datasets:
-                    scan = conv.convert_sidpy_to_scan_pb2(ds)
-                    scan.timestamp.FromDatetime(ts)
-                    scan.filename = scan_path
-                    scans.append(scan)
-                self._old_scans = scans
+        scan_path = self._get_latest_file()
+        if scan_path is None:
+            return self._old_scans
+
+        try:
+            st = os.stat(scan_path)
+        except FileNotFoundError:
+            logger.warning(f"Scan file {scan_path} disappeared before load.")
+            return self._old_scans
+
+        scan_key = (scan_path, st.st_mtime_ns, st.st_size)
+        if scan_key in self._scan_cache:
+            self._scan_cache.move_to_end(scan_key)
+            self._old_scans = self._scan_cache[scan_key]
+            return self._old_scans
+
+        # Imported here, as SciFiReaders is a heavy import (seconds) that is
+        # only needed once we actually load scans.
+        import SciFiReaders as sr
+
+        datasets = None
+        try:
+            logger.debug(f"Getting datasets from {scan_path} (each dataset"
+                         " is a channel).")
+            reader = sr.IgorIBWReader(scan_path)
+            # read() returns a dict of datasets (one per channel).
+            datasets = reader.read(verbose=False).values()
+        except Exception as exc:
+            logger.error(f"Failure loading scan at {scan_path}: {exc}")
+            return self._old_scans
+
+        if datasets:
+            scans = []
+            ts = get_file_modification_datetime(scan_path, st)
+            for ds in datasets:
+                scan = conv.convert_sidpy_to_scan_pb2(ds)
+                scan.timestamp.FromDatetime(ts)
+                scan.filename = scan_path
+                scans.append(scan)
+            self._old_scans = scans
+
+            self._scan_cache[scan_key] = scans
+            if len(self._scan_cache) > self.SCAN_CACHE_SIZE:
+                self._scan_cache.popitem(last=False)
         return self._old_scans
 
+    def _is_poll_due(self, last_poll_ts: float | None) -> bool:
+        """Whether params_poll_period_s has elapsed since last_poll_ts."""
+        return (last_poll_ts is None or
+                time.monotonic() - last_poll_ts >= self.params_poll_period_s)
+
+    def _get_img_dir(self) -> str:
+        """Get the image save directory (python path), cached for a time.
+
+        See IMG_DIR_CACHE_S.
+        """
+        now = time.monotonic()
+        if (self._img_dir_cache is None or
+                now - self._img_dir_cache[0] > self.IMG_DIR_CACHE_S):
+            val = params.get_param(self._client, params.AsylumParam.IMG_PATH)
+            self._img_dir_cache = (now, convert_igor_path_to_python_path(val))
+        return self._img_dir_cache[1]
+
+    def _get_latest_file(self) -> str | None:
+        """Get the path of the latest saved scan file.
+
+        Returns:
+            Path to the most recently modified scan file in the controller's
+            image save directory, or None if there are none.
+        """
+        img_path = self._get_img_dir()
+
+        # A directory's mtime only changes when entries are added, removed or
+        # renamed. If it has not, neither has our latest file (rewriting a
+        # file in place is handled by the scan cache in poll_scans).
+        try:
+            dir_mtime = os.stat(img_path).st_mtime_ns
+        except FileNotFoundError:
+            logger.warning(f"Image save directory {img_path} not found.")
+            return None
+
+        cached = self._latest_file_cache.get(img_path)
+        if cached and cached[0] == dir_mtime:
+            return cached[1]
+
+        # Single pass, with one stat per entry, keeping the latest file.
+        # Hidden (e.g. temporary) files are ignored, as with a '*' glob. On
+        # equal mtimes, the last entry listed wins.
+        latest_path = None
+        latest_mtime = -1
+        with os.scandir(img_path) as it:
+            for entry in it:
+                if (not entry.name.endswith(self.IMG_EXT)
+                        or entry.name.startswith('.')
+                        or not entry.is_file()):
+                    continue
+                mtime = entry.stat().st_mtime_ns
+                if mtime >= latest_mtime:
+                    latest_mtime, latest_path = mtime, entry.path
+
+        self._latest_file_cache[img_path] = (dir_mtime, latest_path)
+        return latest_path
+
     def poll_zctrl_params(self) -> feedback_pb2.ZCtrlParameters:
         """Override polling of zctrl."""
+        if not self._is_poll_due(self._last_zctrl_params_poll_ts):
+            return self.zctrl_params
+        self._last_zctrl_params_poll_ts = time.monotonic()
+
         vals = params.get_param_list(self._client, self.ZCTRL_PARAMS)
-        zctrl_params = feedback_pb2.ZCtrlParameters()
+        zctrl_params = self._poll_zctrl_params_msg
+        zctrl_params.Clear()
         zctrl_params.feedbackOn = False  # TODO: how to read this!?!?!
         zctrl_params.proportionalGain = vals[0]
         zctrl_params.integralGain = vals[1]
@@ -6,6 +6,8 @@ be covered by these methods.
 """
 
 from enum import Enum
+import functools
+import itertools
 import json
 import logging
 from typing import Optional
@@ -15,6 +17,14 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 
 
+try:
+    # Optional: much faster decoding of the (many, small) responses we parse.
+    import orjson
+    _json_loads = orjson.loads
+except ModuleNotFoundError:
+    _json_loads = json.loads
+
+
 IGOR_SEP = ':'
 PY_SEP = '/'
 
@@ -26,8 +36,11 @@ PY_SEP = '/'
 VER_KEY = 'version'
 VER_VAL = 1
 MSG_ID_KEY = 'messageID'
-MSG_COUNTER = 0  # We hold the message id counter
-MSG_COUNTER_OVERFLOW = 500  # Overflow point. I.e. we modulus with this.
+MSG_COUNTER = itertools.count()  # We hold the message id counter
+# Overflow point. A power of two, so we can mask rather than modulus.
+MSG_COUNTER_OVERFLOW = 512
+MSG_COUNTER_MASK = MSG_COUNTER_OVERFLOW - 1
+MSG_ID_TABLE = tuple(str(idx) for idx in range(MSG_COUNTER_OVERFLOW))
 CALL_KEY = 'CallFunction'
 CALL_NAME_KEY = 'name'
 CALL_PARAMS_KEY = 'params'
@@ -38,6 +51,12 @@ VAL_KEY = 'value'
 TYPE_KEY = 'type'
 RES_KEY = 'result'
 
+# Pre-serialized call message, as only the message id and the method dict
+# change between calls. Matches json.dumps() output for the full structure.
+CALL_STR_TEMPLATE = ('{{"{}": {}, "{}": "%s", "{}": %s}}'.format(
+    VER_KEY, VER_VAL, MSG_ID_KEY, CALL_KEY))
+_json_encoder = json.JSONEncoder()
+
 
 class XOPSyntaxError(RuntimeError):
     """Provided input does not meet our expected message syntax."""
@@ -57,12 +76,10 @@ class IgorType(str, Enum):
 
 def _create_message_id() -> str:
     """Create a message id and update message counter."""
-    global MSG_COUNTER
-    message_id = str(MSG_COUNTER)
-    MSG_COUNTER = (MSG_COUNTER + 1) % MSG_COUNTER_OVERFLOW
-    return message_id
+    return MSG_ID_TABLE[next(MSG_COUNTER) & MSG_COUNTER_MASK]
 
 
+@functools.lru_cache(maxsize=16)  # Save dirs rarely change between calls
 def convert_igor_path_to_python_path(igor_path: str) -> str:
     """Converts a path received from Igor into python format.
 
@@ -79,11 +96,11 @@ def convert_igor_path_to_python_path(igor_path: str) -> str:
     """
     python_path = igor_path.replace(IGOR_SEP, PY_SEP)
     first_idx = python_path.find(PY_SEP)
+    if first_idx == -1:  # No separators, nothing to re-insert
+        return python_path
 
     # Add slash to first colon (e.g. 'C:'), as we need a sep (e.g. 'C:/')
-    python_path = (python_path[:first_idx] + IGOR_SEP +
-                   python_path[first_idx:])
-    return python_path
+    return python_path[:first_idx] + IGOR_SEP + python_path[first_idx:]
 
 
 def convert_python_path_to_igor_path(python_path: str) -> str:
@@ -118,15 +135,13 @@ def create_call_string(method_name: str,
         format applicable for the zmq-xop interface.
     """
     message_id = _create_message_id()
-    structure = {VER_KEY: VER_VAL,
-                 MSG_ID_KEY: message_id}
 
     method_dict = {CALL_NAME_KEY: method_name}
     if params:
         method_dict[CALL_PARAMS_KEY] = list(params)
-    structure[CALL_KEY] = method_dict
 
-    return message_id, json.dumps(structure)
+    return message_id, CALL_STR_TEMPLATE % (
+        message_id, _json_encoder.encode(method_dict))
 
 
 def parse_response_string(response: str) -> (int, int, Optional[float | str]):
@@ -141,27 +156,27 @@ def parse_response_string(response: str) -> (int, int, Optional[float | str]):
         - message_id matches the call it is responding to.
         - the return value (if applicable).
     """
-    structure = json.loads(response)
+    structure = _json_loads(response)
+    error_dict = structure.get(ERROR_KEY)
+    message_id = structure.get(MSG_ID_KEY)
 
-    if ERROR_KEY not in structure or MSG_ID_KEY not in structure:
+    if error_dict is None or message_id is None:
         logger.error("ZMQ-XOP Response Received does not make sense!")
         raise XOPSyntaxError
 
-    error = structure[ERROR_KEY][VAL_KEY]
-    message_id = structure[MSG_ID_KEY]
-
+    error = error_dict[VAL_KEY]
     if error != 0:
-        error_msg = structure[ERROR_KEY][MSG_KEY]
-        logger.error(f"Error {error} for message id {message_id}: {error_msg}")
+        logger.error(f"Error {error} for message id {message_id}: "
+                     f"{error_dict.get(MSG_KEY)}")
 
-    if RES_KEY not in structure:
-        return error, error_msg, message_id, None
+    result = structure.get(RES_KEY)
+    if result is None:
+        return error, message_id, None
 
-    res_type = IgorType(structure[RES_KEY][TYPE_KEY])
-    if res_type == IgorType.WAVE:
+    # IgorType is a str enum, so we can compare without constructing one.
+    if result[TYPE_KEY] == IgorType.WAVE:
         logger.error("ZMQ-XOP response included wave, which is not currently "
                      "supported.")
         raise XOPUnsupportedTypeError
 
-    value = structure[RES_KEY][VAL_KEY]
-    return error, message_id, value
+    return error, message_id, result[VAL_KEY]
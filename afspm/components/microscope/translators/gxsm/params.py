@@ -46,11 +46,12 @@ class GxsmParameter(str, enum.Enum):
 
 GET_FAILURE = '\x04'
 
-class GxsmChannelIds(enum.Enum):
+class GxsmChannelIds(enum.IntEnum):
     """Channel choice-to-int mapping.
 
     The int values here correspond to the values gxsm associates to the
-    different channel options (in the channel selection menu).
+    different channel options (in the channel selection menu). As an IntEnum,
+    members can be passed to / compared with gxsm's raw ints directly.
 
     Remember that (with the exception of TOPO), these do not map to traditional
     channel types (such as phase or magnitude), but to internal system
@@ -1,6 +1,8 @@
 """Handles device communication with the gxsm3 controller."""
 
-import os.path
+import os
+import stat
+import time
 import logging
 
 from afspm.components.microscope.translator import (
@@ -32,11 +34,38 @@ class GxsmTranslator(MicroscopeTranslator):
     DSP->Advanced->Z-Control->Enable feedback controller.
 
     Since these cannot be set via the API, we read these via the constructor.
+
+    Attributes:
+        read_engine: xarray backend engine used to read the saved netCDF
+            scan files (e.g. 'scipy', 'netcdf4', 'h5netcdf'). Default is
+            'scipy', which needs no extra dependencies.
+        _old_scans: tuple of the most recently loaded scans. Kept as a tuple
+            so callers cannot mutate it behind our back.
+        last_scan_key: (st_dev, st_ino, st_mtime_ns) of the first channel
+            file of the last scan we loaded, used to detect new scans.
+        _scan_cache: dict mapping the filename of each channel of the latest
+            scan to the ((mtime, size), Scan2d) loaded from it. We use this to
+            avoid re-reading channel files that have not changed.
+        _motor_status_cache: (time.monotonic(), value) of the last coarse
+            motor status we requested, or None. See MOTOR_STATUS_CACHE_S.
     """
 
+    # We *must* set x-values before y-values, because gxsm will scale the
+    # linked y when its x is set. Somewhat confusing, in my opinion.
+    SCAN_PARAMS = (GxsmParameter.TL_X, GxsmParameter.TL_Y,
+                   GxsmParameter.SZ_X, GxsmParameter.SZ_Y,
+                   GxsmParameter.RES_X, GxsmParameter.RES_Y)
+    # Whether each SCAN_PARAMS entry is spatial (i.e. has physical units).
+    SCAN_PARAMS_IS_SPATIAL = (True, True, True, True, False, False)
+
     STATE_RUNNING_THRESH = 0
     MOTOR_RUNNING_THRESH = -2
 
+    # How long we trust our last coarse motor status, in seconds. The motor
+    # status does not change faster than our polling, so we avoid querying it
+    # on every poll (at the cost of up to this much detection latency).
+    MOTOR_STATUS_CACHE_S = 0.2
+
     MAX_NUM_CHANNELS = 6
 
     # This error is sent if you request a channel's filename but provide an
@@ -50,6 +79,7 @@ class GxsmTranslator(MicroscopeTranslator):
                  read_use_physical_units: bool = True,
                  read_allow_convert_from_metadata: bool = False,
                  read_simplify_metadata: bool = True,
+                 read_engine: str = 'scipy',
                  gxsm_physical_units: str = 'angstrom',
                  is_zctrl_feedback_on: bool = True, **kwargs):
         """Initialize internal logic."""
@@ -57,11 +87,14 @@ class GxsmTranslator(MicroscopeTranslator):
         self.read_use_physical_units = read_use_physical_units
         self.read_allow_convert_from_metadata = read_allow_convert_from_metadata
         self.read_simplify_metadata = read_simplify_metadata
+        self.read_engine = read_engine
         self.gxsm_physical_units = gxsm_physical_units  # TODO: read from gxsm?
         self.is_zctrl_feedback_on = is_zctrl_feedback_on  # TODO: read from gxsm?
 
-        self.last_scan_fname = ''
-        self.old_scans = []
+        self.last_scan_key = None
+        self._old_scans = ()
+        self._scan_cache = {}
+        self._motor_status_cache = None
 
         super().__init__(**kwargs)
         self.param_method_map = PARAM_METHOD_MAP
@@ -79,27 +112,18 @@ class GxsmTranslator(MicroscopeTranslator):
     def on_set_scan_params(self, scan_params: scan_pb2.ScanParameters2d
                            ) -> control_pb2.ControlResponse:
         """Override on setting scan params."""
-        # We *must* set x-values before y-values, because gxsm will scale the
-        # linked y when its x is set. Somewhat confusing, in my opinion.
-        attrs = [GxsmParameter.TL_X, GxsmParameter.TL_Y,
-                 GxsmParameter.SZ_X, GxsmParameter.SZ_Y,
-                 GxsmParameter.RES_X, GxsmParameter.RES_Y]
-        vals = [scan_params.spatial.roi.top_left.x,
+        attrs = self.SCAN_PARAMS  # See note on ordering there
+        vals = (scan_params.spatial.roi.top_left.x,
                 scan_params.spatial.roi.top_left.y,
                 scan_params.spatial.roi.size.x,
                 scan_params.spatial.roi.size.y,
                 scan_params.data.shape.x,
-                scan_params.data.shape.y]
-        attr_units = [scan_params.spatial.units,
-                      scan_params.spatial.units,
-                      scan_params.spatial.units,
-                      scan_params.spatial.units,
-                      None, None]
-        gxsm_units = [self.gxsm_physical_units,
-                      self.gxsm_physical_units,
-                      self.gxsm_physical_units,
-                      self.gxsm_physical_units,
-                      None, None]
+                scan_params.data.shape.y)
+        spatial_units = scan_params.spatial.units
+        attr_units = tuple(spatial_units if is_spatial else None
+                           for is_spatial in self.SCAN_PARAMS_IS_SPATIAL)
+        gxsm_units = tuple(self.gxsm_physical_units if is_spatial else None
+                           for is_spatial in self.SCAN_PARAMS_IS_SPATIAL)
 
         # Note: when setting scan params, data units don't matter! These
         # are only important in explicit scans. When setting scan params,
@@ -132,20 +156,20 @@ class GxsmTranslator(MicroscopeTranslator):
 
     def poll_scan_params(self) -> scan_pb2.ScanParameters2d:
         """Override scan params polling."""
-        vals = get_param_list([GxsmParameter.TL_X, GxsmParameter.TL_Y,
-                               GxsmParameter.SZ_X, GxsmParameter.SZ_Y,
-                               GxsmParameter.RES_X, GxsmParameter.RES_Y])
+        vals = get_param_list(self.SCAN_PARAMS)
 
         scan_params = scan_pb2.ScanParameters2d()
-        scan_params.spatial.roi.top_left.x = vals[0]
-        scan_params.spatial.roi.top_left.y = vals[1]
-        scan_params.spatial.roi.size.x = vals[2]
-        scan_params.spatial.roi.size.y = vals[3]
+        roi = scan_params.spatial.roi
+        roi.top_left.x = vals[0]
+        roi.top_left.y = vals[1]
+        roi.size.x = vals[2]
+        roi.size.y = vals[3]
         scan_params.spatial.units = self.gxsm_physical_units
 
         # Note: all gxsm attributes returned as float, must convert to int
-        scan_params.data.shape.x = int(vals[4])
-        scan_params.data.shape.y = int(vals[5])
+        shape = scan_params.data.shape
+        shape.x = int(vals[4])
+        shape.y = int(vals[5])
         # Not setting data units, as these are linked to scan channel
         return scan_params
 
@@ -153,23 +177,33 @@ class GxsmTranslator(MicroscopeTranslator):
         """Override scans polling."""
         channel_idx = 0
         fnames = []
+        # Bound locally, as they are used on every channel iteration.
+        chfname = gxsm.chfname
+        max_num_channels = self.MAX_NUM_CHANNELS
+        error_str = self.CHANNEL_FILENAME_ERROR_STR
         try:
-            while channel_idx < self.MAX_NUM_CHANNELS:
-                fname = gxsm.chfname(channel_idx)
-
-                # Avoid reloading scans if the same. Return old scans.
-                if channel_idx == 0:
-                    if fname == self.last_scan_fname:
-                        return self.old_scans
-                    self.last_scan_fname = fname
+            while channel_idx < max_num_channels:
+                fname = chfname(channel_idx)
 
                 # Break if on last 'set' channel
-                if fname == self.CHANNEL_FILENAME_ERROR_STR:
+                if fname == error_str:
                     break
 
-                # Only append actually saved files
-                if os.path.isfile(fname):
-                    fnames.append(fname)
+                st = _stat_or_none(fname)
+
+                # Avoid reloading scans if the same. Return old scans.
+                # We compare the first channel file's identity and mtime,
+                # so a file rewritten in place is also seen as new.
+                if channel_idx == 0:
+                    scan_key = (None if st is None else
+                                (st.st_dev, st.st_ino, st.st_mtime_ns))
+                    if scan_key == self.last_scan_key:
+                        return self._old_scans
+                    self.last_scan_key = scan_key
+
+                # Only append actually saved files (keeping their stat).
+                if st is not None and stat.S_ISREG(st.st_mode):
+                    fnames.append((fname, st))
                 channel_idx += 1
         except Exception as exc:
             logger.trace(f"Exception with requesting channel {channel_idx}: "
@@ -178,26 +212,55 @@ class GxsmTranslator(MicroscopeTranslator):
         # Avoid reloading scans if they are not new.
         if len(fnames) > 0:
             scans = []
-            for fname in fnames:
-                ts = get_file_modification_datetime(fname)
-                try:
-                    ds = read.open_dataset(
-                        fname, self.read_channels_config_path,
-                        self.read_use_physical_units,
-                        self.read_allow_convert_from_metadata,
-                        self.read_simplify_metadata,
-                        engine='scipy')
-                except Exception as exc:
-                    logger.error(f"Could not read scan fname {fname}, "
-                                 f"got error {exc}.")
-                    continue
-                scan = conv.convert_xarray_to_scan_pb2(
-                    ds[list(ds.data_vars)[0]])  # Grabbing first data variable
-                scan.timestamp.FromDatetime(ts)
-                scan.filename = fname
-                scans.append(scan)
-            self.old_scans = scans
-        return self.old_scans
+            for fname, st in fnames:
+                scan = self._load_scan(fname, st)
+                if scan is not None:
+                    scans.append(scan)
+            self._old_scans = tuple(scans)
+
+            # Only keep the channels of the latest scan around.
+            self._scan_cache = {fname: self._scan_cache[fname]
+                                for fname, __ in fnames
+                                if fname in self._scan_cache}
+        return self._old_scans
+
+    def _load_scan(self, fname: str, st: os.stat_result
+                   ) -> scan_pb2.Scan2d | None:
+        """Load the scan (channel) at fname, unless it is cached.
+
+        The cache is keyed by the file's mtime and size, so we reload a file
+        that has been rewritten.
+
+        Args:
+            fname: path of the channel file to load.
+            st: os.stat() result for fname.
+
+        Returns:
+            Loaded Scan2d, or None if it could not be read.
+        """
+        scan_key = (st.st_mtime_ns, st.st_size)
+        cached = self._scan_cache.get(fname)
+        if cached is not None and cached[0] == scan_key:
+            return cached[1]
+
+        try:
+            ds = read.open_dataset(
+                fname, self.read_channels_config_path,
+                self.read_use_physical_units,
+                self.read_allow_convert_from_metadata,
+                self.read_simplify_metadata,
+                engine=self.read_engine)
+        except Exception as exc:
+            logger.error(f"Could not read scan fname {fname}, "
+                         f"got error {exc}.")
+            return None
+
+        scan = conv.convert_xarray_to_scan_pb2(
+            ds[next(iter(ds.data_vars))])  # Grabbing first data variable
+        scan.timestamp.FromDatetime(get_file_modification_datetime(fname, st))
+        scan.filename = fname
+        self._scan_cache[fname] = (scan_key, scan)
+        return scan
 
     def poll_zctrl_params(self) -> feedback_pb2.ZCtrlParameters:
         """Poll the controller for the current Z-Control parameters."""
@@ -209,8 +272,7 @@ class GxsmTranslator(MicroscopeTranslator):
         zctrl_params.integralGain = vals[1]
         return zctrl_params
 
-    @staticmethod
-    def _get_current_scan_state() -> scan_pb2.ScanState:
+    def _get_current_scan_state(self) -> scan_pb2.ScanState:
         """Return the current scan state.
 
         This queries gxsm for its current scan state.
@@ -219,19 +281,51 @@ class GxsmTranslator(MicroscopeTranslator):
             ScanState, or None if query fails.
         """
         svec = gxsm.rtquery('s')
-        s = int(svec[0])
-        # (2+4) == Scanning; 8 == Vector Probe
-        scanning = (s & (2+4) > GxsmTranslator.STATE_RUNNING_THRESH or
-                    s & 8 > GxsmTranslator.STATE_RUNNING_THRESH)
-        moving = s & 16 > GxsmTranslator.STATE_RUNNING_THRESH
+        state = _SCAN_STATE_TABLE[int(svec[0]) & _SCAN_STATE_BITS_MASK]
+        if state != scan_pb2.ScanState.SS_FREE:
+            return state
 
         # TODO: investigate motor logic further...
-        motor_running = (get_param(GxsmParameter.MOTOR) <
-                         GxsmTranslator.MOTOR_RUNNING_THRESH)
+        # We only query the motor when not scanning/moving, as the coarse
+        # motor is not expected to run at the same time. This saves a gxsm
+        # call on every busy poll.
+        now = time.monotonic()
+        if (self._motor_status_cache is None or
+                now - self._motor_status_cache[0] >
+                self.MOTOR_STATUS_CACHE_S):
+            self._motor_status_cache = (now,
+                                        get_param(GxsmParameter.MOTOR))
+        motor_running = (self._motor_status_cache[1] <
+                         self.MOTOR_RUNNING_THRESH)
         if motor_running:
             return scan_pb2.ScanState.SS_MOTOR_RUNNING
-        if scanning:
-            return scan_pb2.ScanState.SS_SCANNING
-        if moving:
-            return scan_pb2.ScanState.SS_MOVING
         return scan_pb2.ScanState.SS_FREE
+
+
+def _classify_scan_state_bits(s: int) -> scan_pb2.ScanState:
+    """Map gxsm's rtquery('s') state bits to a ScanState (ignoring motor)."""
+    # (2+4) == Scanning; 8 == Vector Probe
+    scanning = (s & (2+4) > GxsmTranslator.STATE_RUNNING_THRESH or
+                s & 8 > GxsmTranslator.STATE_RUNNING_THRESH)
+    moving = s & 16 > GxsmTranslator.STATE_RUNNING_THRESH
+
+    if scanning:
+        return scan_pb2.ScanState.SS_SCANNING
+    if moving:
+        return scan_pb2.ScanState.SS_MOVING
+    return scan_pb2.ScanState.SS_FREE
+
+
+# Precomputed _classify_scan_state_bits() for all combinations of the bits
+# it checks, so polling the state is a single lookup.
+_SCAN_STATE_BITS_MASK = 2 | 4 | 8 | 16
+_SCAN_STATE_TABLE = tuple(_classify_scan_state_bits(s)
+                          for s in range(_SCAN_STATE_BITS_MASK + 1))
+
+
+def _stat_or_none(fname: str) -> os.stat_result | None:
+    """Return os.stat() of fname, or None if it cannot be stat-ed."""
+    try:
+        return os.stat(fname)
+    except OSError:
+        return None
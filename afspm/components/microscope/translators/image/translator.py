@@ -2,14 +2,16 @@
 
 import time
 import logging
+from collections import OrderedDict
 from pathlib import Path
 from os import sep
 
-import xarray as xr
 import numpy as np
+from scipy import ndimage
 
 from ...translator import MicroscopeTranslator
 from .....io.protos.generated import scan_pb2
+from .....io.protos.generated import geometry_pb2
 from .....io.protos.generated import control_pb2
 from .....io.protos.generated import feedback_pb2
 from .....utils import array_converters as ac
@@ -18,6 +20,11 @@ from .....utils import array_converters as ac
 logger = logging.getLogger(__name__)
 
 
+# Tolerance (in pixels) within which scan points are considered to lie on the
+# image's bounds (see _get_pixel_indices()).
+_PIXEL_INDEX_TOL = 1e-9
+
+
 class ImageTranslator(MicroscopeTranslator):
     """Simulates a MicroscopeTranslator with an individual image.
 
@@ -29,12 +36,20 @@ class ImageTranslator(MicroscopeTranslator):
         dev_scan_state: current scanning state.
         dev_scan_params: current scan parameters.
         dev_scan: latest scan.
+        _img_vals: dev_img's data, as a float64 array (for interpolation).
+        _img_origin: (x, y) physical coordinates of dev_img's first pixel.
+        _img_step: (x, y) physical step between dev_img's pixels.
+        _img_units: dev_img's data units (None if not set).
+        _scan_cache: OrderedDict of recently created scans (LRU order), keyed
+            by the scan parameters they were created from.
 
         scan_time_s: how long a scan should take, in seconds.
         move_time_s: how long changing scan paramters should take, in seconds.
         start_ts: a timestamp for timing the scan and move durations.
     """
 
+    SCAN_CACHE_SIZE = 16  # Max number of scans kept in _scan_cache.
+
     _DEFAULT_IMG_PATH = (str(Path(__file__).parent.resolve()) + sep + "data" +
                          sep + "peppers.tiff")
 
@@ -65,6 +80,17 @@ class ImageTranslator(MicroscopeTranslator):
                                                       physical_size,
                                                       physical_units,
                                                       data_units)
+        # dev_img is fixed and regularly spaced, so we store what we need to
+        # map physical coordinates to (fractional) pixel indices.
+        self._img_vals = np.asarray(self.dev_img.values, dtype=np.float64)
+        x_coords = self.dev_img.x.values
+        y_coords = self.dev_img.y.values
+        self._img_origin = (x_coords[0], y_coords[0])
+        self._img_step = (x_coords[1] - x_coords[0],
+                          y_coords[1] - y_coords[0])
+        self._img_units = self.dev_img.attrs.get('units')
+        self._scan_cache = OrderedDict()
+
         self.dev_scan_state = scan_pb2.ScanState.SS_FREE
         self.dev_scan_params = scan_pb2.ScanParameters2d()
         self.dev_scan = None
@@ -129,7 +155,33 @@ class ImageTranslator(MicroscopeTranslator):
         super().run_per_loop()
 
     def update_scan(self):
-        """Updates the latest scan based on the latest scan params."""
+        """Updates the latest scan based on the latest scan params.
+
+        dev_img is fixed, so scans are cached by the parameters they were
+        created from. dev_scan is always a copy, as run_per_loop() modifies
+        its timestamp and filename.
+        """
+        key = (self.dev_scan_params.spatial.roi.top_left.x,
+               self.dev_scan_params.spatial.roi.top_left.y,
+               self.dev_scan_params.spatial.roi.size.x,
+               self.dev_scan_params.spatial.roi.size.y,
+               self.dev_scan_params.data.shape.x,
+               self.dev_scan_params.data.shape.y,
+               self.dev_scan_params.spatial.units)
+        scan = self._scan_cache.get(key)
+        if scan is None:
+            scan = self._create_scan()
+            self._scan_cache[key] = scan
+            if len(self._scan_cache) > self.SCAN_CACHE_SIZE:
+                self._scan_cache.popitem(last=False)
+        else:
+            self._scan_cache.move_to_end(key)
+
+        self.dev_scan = scan_pb2.Scan2d()
+        self.dev_scan.CopyFrom(scan)
+
+    def _create_scan(self) -> scan_pb2.Scan2d:
+        """Create a scan from dev_img, based on the latest scan params."""
         tl = [self.dev_scan_params.spatial.roi.top_left.x,
               self.dev_scan_params.spatial.roi.top_left.y]
         size = [self.dev_scan_params.spatial.roi.size.x,
@@ -137,19 +189,38 @@ class ImageTranslator(MicroscopeTranslator):
         data_shape = [self.dev_scan_params.data.shape.x,
                       self.dev_scan_params.data.shape.y]
 
-        x = np.linspace(tl[0], tl[0] + size[0], data_shape[0])
-        y = np.linspace(tl[1], tl[1] + size[1], data_shape[1])
-
-        # Wrapping in DataArray, to feed coordinates with units.
-        # Alternatively, could just feed interp(x=x, y=y)
-        units = self.dev_scan_params.spatial.units
-        da = xr.DataArray(data=None, dims=['y', 'x'],
-                          coords={'y': y, 'x': x})
-        da.x.attrs['units'] = units
-        da.y.attrs['units'] = units
+        # Bilinear interpolation at the (fractional) pixel indices of each
+        # scan point, with NaN outside of the image. This matches
+        # dev_img.interp(x=x, y=y) with x/y as np.linspace(tl, tl + size,
+        # data_shape), but avoids xarray's indexing overhead.
+        cols = _get_pixel_indices(tl[0], size[0], data_shape[0],
+                                  self._img_origin[0], self._img_step[0],
+                                  self._img_vals.shape[1])
+        rows = _get_pixel_indices(tl[1], size[1], data_shape[1],
+                                  self._img_origin[1], self._img_step[1],
+                                  self._img_vals.shape[0])
+        rows, cols = np.meshgrid(rows, cols, indexing='ij')
+        vals = ndimage.map_coordinates(self._img_vals, (rows, cols), order=1,
+                                       mode='constant', cval=np.nan)
 
-        img = self.dev_img.interp(x=da.x, y=da.y)
-        self.dev_scan = ac.convert_xarray_to_scan_pb2(img)
+        # Build the scan directly (rather than wrapping vals in a DataArray
+        # for ac.convert_xarray_to_scan_pb2()), as we already know all of
+        # its metadata. Mirrors the converter's output, including its shape
+        # ordering.
+        x_min, x_max = _get_extents(tl[0], size[0], data_shape[0])
+        y_min, y_max = _get_extents(tl[1], size[1], data_shape[1])
+        spatial = scan_pb2.SpatialAspects(
+            roi=geometry_pb2.Rect2d(
+                top_left=geometry_pb2.Point2d(x=x_min, y=y_min),
+                size=geometry_pb2.Size2d(x=x_max - x_min, y=y_max - y_min)),
+            units=self.dev_scan_params.spatial.units)
+        data = scan_pb2.DataAspects(
+            shape=geometry_pb2.Size2u(x=vals.shape[0], y=vals.shape[1]),
+            units=self._img_units)
+        return scan_pb2.Scan2d(
+            params=scan_pb2.ScanParameters2d(spatial=spatial, data=data),
+            channel=self.dev_img.name,
+            values=ac.convert_array_to_values(vals))
 
     def _simulate_filename(self) -> str:
         """Simulate a fake filename, for testing.
@@ -160,3 +231,37 @@ class ImageTranslator(MicroscopeTranslator):
         fname = './' + str(self.file_id) + '.png'
         self.file_id += 1
         return fname
+
+
+def _get_pixel_indices(start: float, length: float, num: int,
+                       img_origin: float, img_step: float,
+                       img_num: int) -> np.ndarray:
+    """Get the (fractional) image pixel indices of num evenly spaced points.
+
+    The points are np.linspace(start, start + length, num). Indices within
+    _PIXEL_INDEX_TOL of the image bounds are snapped onto them, so that float
+    error does not push points on the image edge outside of it (where they
+    would be interpolated as NaN).
+
+    Args:
+        start: physical coordinate of the first point.
+        length: physical distance between the first and last point.
+        num: number of points.
+        img_origin: physical coordinate of the image's first pixel.
+        img_step: physical step between the image's pixels.
+        img_num: number of image pixels along this dimension.
+
+    Returns:
+        1D float64 array of fractional pixel indices.
+    """
+    indices = (np.linspace(start, start + length, num) - img_origin) / img_step
+    for bound in (0, img_num - 1):
+        indices[np.abs(indices - bound) < _PIXEL_INDEX_TOL] = bound
+    return indices
+
+
+def _get_extents(start: float, length: float, num: int
+                 ) -> tuple[float, float]:
+    """Get the (min, max) of np.linspace(start, start + length, num)."""
+    end = start + length if num > 1 else start
+    return min(start, end), max(start, end)
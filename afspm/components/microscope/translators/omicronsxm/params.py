@@ -14,7 +14,7 @@ from types import MappingProxyType  # Immutable dict
 from afspm.components.microscope import params
 from afspm.utils import units
 
-from ...io.protos.generated import scan_pb2
+from afspm.io.protos.generated import scan_pb2
 from afspm.io.protos.generated import feedback_pb2
 
 from SXMRemote import DDEClient
@@ -23,7 +23,7 @@ logger = logging.getLogger(__name__)
 
 
 # ----- Omicron Params ----- #
-class OmicronParameter(str, enum.Emum):  # TODO why not "OmicronParameterS"?
+class OmicronParameter(str, enum.Enum):  # TODO why not "OmicronParameterS"?
     """Omicron internal parameters.
 
     NOTE: Omicron keeps track of the scan region using the coordinates of the
@@ -94,8 +94,25 @@ SCAN_PARAM = ["X", "Y", "Range", "Pixel"]
 FEEDBACK_PARAM = ["Enable", "Ki", "Kp"]
 ON_OFF_PARAM = ["Scan"]
 
-# It's also useful to have a list of the afspm parameters
-AFSPM_PARAMS = [e.name for e in OmicronParameter]
+# Sets of the above, for quick dispatch in set_param() / get_param().
+_SCAN_PARAM_SET = frozenset(SCAN_PARAM) | frozenset(ON_OFF_PARAM)
+_FEEDBACK_PARAM_SET = frozenset(FEEDBACK_PARAM)
+
+# Command prefixes for setting the above, so only the value is formatted when
+# sending a command.
+_SCAN_PARAM_CMD_PREFIXES = MappingProxyType({
+    attr: "ScanPara('%s'," % attr for attr in _SCAN_PARAM_SET})
+_FEEDBACK_PARAM_CMD_PREFIXES = MappingProxyType({
+    attr: "FeedPara('%s'," % attr for attr in _FEEDBACK_PARAM_SET})
+
+# Omicron units of the ScanParameters2d values, in OmicronParameter order
+# (TL_X, TL_Y, SZ_X, SZ_Y, RES_X, RES_Y). Pixel is unitless (note
+# OmicronParameterUnit.Pixel holds 'None', as a str enum).
+_SCAN_PARAM_UNITS = (OmicronParameterUnit.X.value,
+                     OmicronParameterUnit.Y.value,
+                     OmicronParameterUnit.Range.value,
+                     OmicronParameterUnit.Range.value,
+                     None, None)
 
 # The Anfatec controller only supports some specific resolution values.
 # It expects to receive the index of the pixel count (1-indexed) in this list
@@ -112,6 +129,10 @@ AFSPM_PARAMS = [e.name for e in OmicronParameter]
 # we don't try to set the resolution (do nothing)
 ANFATEC_RESOLUTION = [32, 64, 128, 256, 512]
 
+# Pixel count -> (1-indexed) index expected by the Anfatec controller.
+_ANFATEC_RES_INDEX = MappingProxyType({
+    res: idx + 1 for idx, res in enumerate(ANFATEC_RESOLUTION)})
+
 
 # ----- Getters / Setters ----- #
 def _set_scan_param(client: DDEClient, attr: str, val: Any) -> None:
@@ -132,7 +153,7 @@ def _set_scan_param(client: DDEClient, attr: str, val: Any) -> None:
         ParameterError if setting fails
     """
     try:
-        client.SendWait(f"ScanPara('{attr}',{val});")
+        client.SendWait(_SCAN_PARAM_CMD_PREFIXES[attr] + f"{val});")
     except Exception as e:
         msg = f"Error setting scan parameter {attr} to {val}: {e}"
         logger.error(msg)
@@ -157,7 +178,7 @@ def _set_feedback_param(client: DDEClient, attr: str, val: Any) -> None:
         ParameterError if setting fails
     """
     try:
-        client.SendWait(f"FeedPara('{attr}',{val});")
+        client.SendWait(_FEEDBACK_PARAM_CMD_PREFIXES[attr] + f"{val});")
     except Exception as e:
         msg = f"Error setting ZCtrl parameter {attr} to {val}: {e}"
         logger.error(msg)
@@ -179,9 +200,9 @@ def set_param(client: DDEClient, attr: str, val: Any) -> None:
     """
     # because there is no way of telling whether the command to SXMRemote is
     # successful, we ensure here that the parameter name exists
-    if attr in SCAN_PARAM or attr in ON_OFF_PARAM: 
+    if attr in _SCAN_PARAM_SET:
         return _set_scan_param(client, attr, val)
-    elif attr in FEEDBACK_PARAM:
+    elif attr in _FEEDBACK_PARAM_SET:
         return _set_feedback_param(client, attr, val)
     else:
         msg = f"Invalid parameter: {attr}."
@@ -189,6 +210,35 @@ def set_param(client: DDEClient, attr: str, val: Any) -> None:
         raise ValueError(msg)
 
 
+def _set_param_list(client: DDEClient, attrs: list[str], vals: list[Any],
+                    cmd_prefixes: MappingProxyType) -> None:
+    """Set multiple parameters of the same category in a single command.
+
+    SXM accepts semicolon-separated statements in a single command, so we set
+    all parameters in one DDE round trip. If that fails, we fall back to
+    setting them one by one, so the failing parameter can be identified.
+
+    Args:
+        client: The DDE client connected to the Omicron controller.
+        attrs: names of attributes, in Omicron terminology.
+        vals: values to set, in Omicron units.
+        cmd_prefixes: command prefixes of the attributes' category (i.e.
+            _SCAN_PARAM_CMD_PREFIXES or _FEEDBACK_PARAM_CMD_PREFIXES).
+
+    Raises:
+        ParameterError if setting fails
+        ValueError if an attr is not recognized
+    """
+    try:
+        client.SendWait(''.join([cmd_prefixes[attr] + f"{val});"
+                                 for attr, val in zip(attrs, vals)]))
+    except Exception as e:
+        logger.warning(f"Error setting parameters {attrs} to {vals} in one "
+                       f"command: {e}. Setting them one by one.")
+        for attr, val in zip(attrs, vals):
+            set_param(client, attr, val)
+
+
 def _get_scan_param(client: DDEClient, attr: str) -> float:
     """ Gets the specified scan parameter's value from the Omicron controller.
 
@@ -285,9 +335,9 @@ def get_param(client: DDEClient, attr: str) -> float:
         Python interface ("SXMRemote")
         SXMRemote returns null as the parameter value.
     """
-    if attr in SCAN_PARAM or attr in ON_OFF_PARAM:
+    if attr in _SCAN_PARAM_SET:
         return _get_scan_param(client, attr)
-    elif attr in FEEDBACK_PARAM: 
+    elif attr in _FEEDBACK_PARAM_SET:
         return _get_feedback_param(client, attr)
     else:
         msg = ("Parameter not supported. Verify spelling. To add support for"
@@ -342,17 +392,9 @@ def set_pb2_scan_params(client: DDEClient, message: scan_pb2.ScanParameters2d
                    message.spatial.units,
                    None, None]
 
-    # Convert values to omicron units    TODO can use units.convert_list
-    vals_converted = []
-    for index, val in enumerate(vals):
-        # TODO here use uuid from the new util method
-        # WARNING: this assumes the lists order matches the order in 
-        # OmicronParameter.
-        # if error look here, could be wrong syntax
-        omicron_equivalent = OmicronParameter[AFSPM_PARAMS[index]].name
-        converted = units.convert(val, given_units[index], 
-                                  OmicronParameterUnit[omicron_equivalent])
-        vals_converted.append(converted)
+    # Convert values to omicron units. WARNING: this assumes the vals order
+    # matches the order in OmicronParameter (see _SCAN_PARAM_UNITS).
+    vals_converted = units.convert_list(vals, given_units, _SCAN_PARAM_UNITS)
 
     # TODO: See if you can switch to this rather than vals-converted (hard to read)
     # x, y, w, h, pix_x, pix_y = vals_converted # BUT DIFFERENT NAMES!
@@ -369,10 +411,8 @@ def set_pb2_scan_params(client: DDEClient, message: scan_pb2.ScanParameters2d
     if resolution[0] != resolution[1]:
         logger.warning("X- and Y-resolution are not equal. Taking the largest"+
                        "of the two.")
-    pixel = max(resolution)
-    try:
-        pixel = ANFATEC_RESOLUTION.index(pixel) + 1
-    except ValueError:
+    pixel = _ANFATEC_RES_INDEX.get(int(round(max(resolution))))
+    if pixel is None:
         msg = ("Tried to set the resolution to an unsupported value.\n" +
                f"Supported values: {ANFATEC_RESOLUTION}")
         logger.error(msg)
@@ -387,9 +427,8 @@ def set_pb2_scan_params(client: DDEClient, message: scan_pb2.ScanParameters2d
         y = vals_converted[1] - 0.5 * vals_converted[3]
 
     # Set values
-    for (attr, val) in zip(SCAN_PARAM, [x, y, range, pixel]):
-        set_param(client, attr, val)
-    # TODO could call instead _set_scan_param(), any difference?
+    _set_param_list(client, SCAN_PARAM, [x, y, range, pixel],
+                    _SCAN_PARAM_CMD_PREFIXES)
 
 
 def set_pb2_feedback_params(client: DDEClient,
@@ -405,11 +444,11 @@ def set_pb2_feedback_params(client: DDEClient,
         ParameterError if an invalid parameter value is given
         ValueError is an invalid parameter name is given
     """
-    for val, attr in zip([float(message.feedbackOn), message.integralGain,
-                          message.proportionalGain],
-                         FEEDBACK_PARAM):
-        # there are no units for feedback parameters, so no conversion needed
-        set_param(client, attr, val)
+    # there are no units for feedback parameters, so no conversion needed
+    _set_param_list(client, FEEDBACK_PARAM,
+                    [float(message.feedbackOn), message.integralGain,
+                     message.proportionalGain],
+                    _FEEDBACK_PARAM_CMD_PREFIXES)
 
 
 def get_all_scan_params(client: DDEClient) -> list[float]:
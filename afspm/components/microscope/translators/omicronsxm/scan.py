@@ -7,7 +7,6 @@ For omicron, the formats are:
 TODO update comments
 """
 
-from glob import glob
 import os
 import logging
 
@@ -33,9 +32,19 @@ def get_latest_scan_metadata_path(dir: str) -> str:
         ValueError if the file structure is incorrect (i.e. there are
             no/several metadata files in a sub-directory).
     """
+    # Single pass over the directory, stat-ing each sub-directory once.
+    # Hidden entries are ignored (as with a '*' glob).
     try:
-        latest_dir = max(glob(os.path.join(dir, '*/')), key=os.path.getmtime)
-    except ValueError:
+        with os.scandir(dir) as it:
+            latest_dir = max((entry for entry in it
+                              if entry.is_dir()
+                              and not entry.name.startswith('.')),
+                             key=lambda entry: entry.stat().st_mtime,
+                             default=None)
+    except FileNotFoundError:
+        latest_dir = None
+
+    if latest_dir is None:
         #TODO should this be warning or error? could ignore and return nothing/empty scan
         msg = ("No sub-directory (scans) found in cave directory when "
                "polling latest scan")
@@ -43,11 +52,13 @@ def get_latest_scan_metadata_path(dir: str) -> str:
         raise FileNotFoundError(msg)
 
     try:
-        txts = glob(os.path.join(latest_dir, "*.txt"))
+        txts = [os.path.join(latest_dir.path, fname)
+                for fname in os.listdir(latest_dir.path)
+                if fname.endswith('.txt') and not fname.startswith('.')]
         if len(txts) != 1:      #there should only be one .txt per dir.
             # TODO: check that this is actually the case
             msg = (f"Found {len(txts)} txt files in scan directory " +
-                   f"{latest_dir} when there should only be one.")
+                   f"{latest_dir.path} when there should only be one.")
             logger.error(msg)
             raise ValueError(msg)
     except ValueError:
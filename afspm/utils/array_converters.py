@@ -1,25 +1,38 @@
 """Array converter helpers."""
 
 import logging
+from typing import TYPE_CHECKING
 import xarray as xr
 import numpy as np
 import imageio.v3 as iio
 from ..io.protos.generated import scan_pb2
 from ..io.protos.generated import geometry_pb2
 
+if TYPE_CHECKING:  # Only for annotations, see _import_sidpy()
+    import sidpy
+
 
 logger = logging.getLogger(__name__)
 
 
-try:
-    import sidpy
-    from sidpy.sid import Dataset
-except ModuleNotFoundError:
-    logger.warning("You don't have sidpy installed. "
-                   "If you wish to use this method, you will need to install "
-                   "it (pip install sidpy) before attempting.")
-    sidpy = None
-    Dataset = None
+def _import_sidpy():
+    """Import and return sidpy, on first use of a sidpy converter.
+
+    sidpy is an optional and heavy (seconds) import, which most users of this
+    module never need. Thus, we only import it when required.
+
+    Raises:
+        ModuleNotFoundError if sidpy is not installed.
+    """
+    try:
+        import sidpy
+    except ModuleNotFoundError as exc:
+        logger.error("You don't have sidpy installed. "
+                     "If you wish to use this method, you will need to "
+                     "install it (pip install sidpy) before attempting.")
+        raise ModuleNotFoundError("sidpy is required for this method."
+                                  ) from exc
+    return sidpy
 
 
 def convert_scan_pb2_to_xarray(scan: scan_pb2.Scan2d) -> xr.DataArray:
@@ -86,11 +99,11 @@ def convert_xarray_to_scan_pb2(da: xr.DataArray) -> scan_pb2.Scan2d:
                                             data=data_aspects)
     scan = scan_pb2.Scan2d(params=scan_params,
                            channel=da.name,
-                           values=da.values.ravel().tolist())
+                           values=convert_array_to_values(da.values))
     return scan
 
 
-def convert_scan_pb2_to_sidpy(scan: scan_pb2.Scan2d) -> Dataset:
+def convert_scan_pb2_to_sidpy(scan: scan_pb2.Scan2d) -> 'sidpy.Dataset':
     """Convert protobuf Scan message to sidpy Dataset.
 
     Args:
@@ -100,10 +113,9 @@ def convert_scan_pb2_to_sidpy(scan: scan_pb2.Scan2d) -> Dataset:
         sidpy Dataset instance.
 
     Raises:
-        None.
+        ModuleNotFoundError if sidpy is not installed.
     """
-    if not sidpy:
-        raise ModuleNotFoundError("sidpy is required for this method.")
+    sidpy = _import_sidpy()
 
     roi = scan.params.spatial.roi
     x = np.linspace(roi.top_left.x, roi.top_left.x + roi.size.x,
@@ -130,7 +142,7 @@ def convert_scan_pb2_to_sidpy(scan: scan_pb2.Scan2d) -> Dataset:
     return dset
 
 
-def convert_sidpy_to_scan_pb2(ds: Dataset) -> scan_pb2.Scan2d:
+def convert_sidpy_to_scan_pb2(ds: 'sidpy.Dataset') -> scan_pb2.Scan2d:
     """Convert sidpy Dataset to protobuf Scan message.
 
     Args:
@@ -139,10 +151,9 @@ def convert_sidpy_to_scan_pb2(ds: Dataset) -> scan_pb2.Scan2d:
         protobuf Scan2d message
 
     Raises:
-        None.
+        ModuleNotFoundError if sidpy is not installed.
     """
-    if not sidpy:
-        raise ModuleNotFoundError("sidpy is required for this method.")
+    _import_sidpy()  # Ensure it is available
 
     da_shape = geometry_pb2.Size2u(x=ds.shape[0],
                                    y=ds.shape[1])
@@ -163,10 +174,25 @@ def convert_sidpy_to_scan_pb2(ds: Dataset) -> scan_pb2.Scan2d:
 
     scan = scan_pb2.Scan2d(params=scan_params,
                            channel=ds.quantity,
-                           values=ds.compute().ravel().tolist())
+                           values=convert_array_to_values(ds.compute()))
     return scan
 
 
+def convert_array_to_values(arr: np.ndarray) -> list[float]:
+    """Flatten an array into a list, for a Scan2d's values field.
+
+    We ensure a C-ordered float64 array first (values is a repeated double),
+    so the ravel is a view and the only copy is the final list.
+
+    Args:
+        arr: array (or array-like) of scan values.
+
+    Returns:
+        list of floats, in row-major order.
+    """
+    return np.ascontiguousarray(arr, dtype=np.float64).ravel().tolist()
+
+
 def create_xarray_from_img_path(img_path: str,
                                 tl: tuple[float, float] = None,
                                 size: tuple[float, float] = None,
@@ -0,0 +1,184 @@
+"""Tests to validate the XopClient talks to a zmq-xop server properly.
+
+We use an in-process zmq ROUTER stub in place of the zmq-xop server. It
+replies to each call with the call's first parameter, so we can check which
+request a result belongs to.
+"""
+
+import json
+import itertools
+import time
+import logging
+import threading
+
+import pytest
+import zmq
+
+from afspm.components.microscope.translators.asylum import xop
+from afspm.components.microscope.translators.asylum.client import XopClient
+
+
+logger = logging.getLogger(__name__)
+
+
+URL = 'inproc://xop_stub'
+STUB_POLL_MS = 5
+
+
+def reply(router: zmq.Socket, request: tuple[bytes, bytes]):
+    """Reply to a (client identity, call string) request."""
+    identity, call = request
+    structure = json.loads(call)
+    rep = {xop.ERROR_KEY: {xop.VAL_KEY: 0},
+           xop.MSG_ID_KEY: structure[xop.MSG_ID_KEY],
+           xop.RES_KEY: {xop.TYPE_KEY: xop.IgorType.STRING.value,
+                         xop.VAL_KEY: structure[xop.CALL_KEY][
+                             xop.CALL_PARAMS_KEY][0]}}
+    router.send_multipart([identity, b'', json.dumps(rep).encode()])
+
+
+def reply_serially(delay_s: float):
+    """Create a policy replying to each request in turn, after delay_s."""
+    def policy(router, pending):
+        for request in pending:
+            time.sleep(delay_s)
+            reply(router, request)
+        return []
+    return policy
+
+
+def reply_reversed(num: int):
+    """Create a policy replying in reverse order, once num requests arrive."""
+    def policy(router, pending):
+        if len(pending) < num:
+            return pending
+        for request in reversed(pending):
+            reply(router, request)
+        return []
+    return policy
+
+
+def reply_late_to_first():
+    """Create a policy only replying to the first request with the second.
+
+    Once the second request arrives, we reply to both (in order), so the
+    first reply arrives well after the client stopped waiting for it.
+    """
+    def policy(router, pending):
+        if len(pending) < 2:
+            return pending
+        for request in pending:
+            reply(router, request)
+        return []
+    return policy
+
+
+def run_stub(ctx: zmq.Context, policy, ready: threading.Event,
+             stop: threading.Event):
+    """Receive requests and hand them to policy, until stopped.
+
+    policy(router, pending) is called with the list of pending requests on
+    every iteration, and returns those it did not reply to (yet).
+    """
+    router = ctx.socket(zmq.ROUTER)
+    router.bind(URL)
+    ready.set()
+
+    pending = []
+    while not stop.is_set():
+        if router.poll(STUB_POLL_MS):
+            identity, __, call = router.recv_multipart()
+            pending.append((identity, call))
+        pending = policy(router, pending)
+    router.close(linger=0)
+
+
+@pytest.fixture(autouse=True)
+def msg_counter(monkeypatch):
+    """Use our own message counter, so as not to affect other tests."""
+    monkeypatch.setattr(xop, 'MSG_COUNTER', itertools.count())
+
+
+@pytest.fixture
+def ctx():
+    ctx = zmq.Context()
+    yield ctx
+    ctx.destroy(linger=0)
+
+
+@pytest.fixture
+def start_stub(ctx):
+    """Start a stub server with the provided policy (stopped on teardown)."""
+    stop = threading.Event()
+    threads = []
+
+    def start(policy):
+        ready = threading.Event()
+        thread = threading.Thread(target=run_stub,
+                                  args=(ctx, policy, ready, stop))
+        thread.start()
+        ready.wait()
+        threads.append(thread)
+
+    yield start
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+
+@pytest.fixture
+def attrs():
+    return ('ScanSize', 'PointsLines', 'ScanLines', 'XOffset', 'YOffset',
+            'ScanAngle', 'ScanRate')
+
+
+def test_send_request(ctx, start_stub):
+    logger.info("Validating a single request is responded to.")
+    start_stub(reply_serially(0))
+    client = XopClient(URL, ctx=ctx)
+
+    assert client.send_request('GV', ('ScanSize',)) == (True, 'ScanSize')
+
+
+def test_send_request_batch_slow_server(ctx, start_stub, attrs):
+    logger.info("Validating a batch succeeds when each response arrives "
+                "within the timeout, even if the batch as a whole does not.")
+    delay_s = 0.05
+    client = XopClient(URL, ctx=ctx)
+    assert delay_s * len(attrs) * 1000 > client._timeout_ms
+
+    start_stub(reply_serially(delay_s))
+    results = client.send_request_batch(tuple(('GV', (attr,))
+                                              for attr in attrs))
+
+    assert results == [(True, attr) for attr in attrs]
+
+
+def test_send_request_timeout(ctx, start_stub):
+    logger.info("Validating a response slower than the timeout fails.")
+    client = XopClient(URL, ctx=ctx)
+    start_stub(reply_serially(2 * client._timeout_ms / 1000))
+
+    assert client.send_request('GV', ('ScanSize',)) == (False, None)
+
+
+def test_send_request_batch_out_of_order(ctx, start_stub, attrs):
+    logger.info("Validating responses arriving out of order are matched to "
+                "their requests, and results keep the request order.")
+    start_stub(reply_reversed(len(attrs)))
+    client = XopClient(URL, ctx=ctx)
+
+    results = client.send_request_batch(tuple(('GV', (attr,))
+                                              for attr in attrs))
+
+    assert results == [(True, attr) for attr in attrs]
+
+
+def test_send_request_drops_late_response(ctx, start_stub):
+    logger.info("Validating a late response to a timed-out request is "
+                "ignored by the following request.")
+    start_stub(reply_late_to_first())
+    client = XopClient(URL, ctx=ctx)
+
+    assert client.send_request('GV', ('ScanSize',)) == (False, None)
+    assert client.send_request('GV', ('ScanRate',)) == (True, 'ScanRate')
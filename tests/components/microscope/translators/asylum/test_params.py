@@ -0,0 +1,66 @@
+"""Tests to validate asylum parameter getting/setting logic."""
+
+import pytest
+import logging
+
+from afspm.components.microscope import params as mparams
+from afspm.components.microscope.translators.asylum import params
+
+
+logger = logging.getLogger(__name__)
+
+
+class StubClient:
+    """XopClient stand-in, recording the requests it was sent.
+
+    Get requests are responded to with get_vals; set requests succeed.
+    """
+
+    def __init__(self, get_vals: dict):
+        self.get_vals = get_vals
+        self.sent = []
+
+    def send_request_batch(self, requests):
+        self.sent.extend(requests)
+        return [(True, self.get_vals.get(param_str))
+                if method in (params.AsylumMethod.GET_VALUE,
+                              params.AsylumMethod.GET_STRING)
+                else (True, None)
+                for method, (param_str, *__) in requests]
+
+
+@pytest.fixture
+def save_params():
+    return (params.AsylumParam.SAVE_IMAGE, params.AsylumParam.LAST_SCAN)
+
+
+@pytest.fixture
+def save_param_strs(save_params):
+    return tuple(params.PARAM_STR_MAP[param] for param in save_params)
+
+
+def test_get_and_set_param_list(save_params, save_param_strs):
+    logger.info("Validating we get the old values, then set the new ones.")
+    client = StubClient(dict(zip(save_param_strs, (0, 0))))
+
+    success, old_vals = params.get_and_set_param_list(client, save_params,
+                                                      (2, 2))
+
+    assert success
+    assert old_vals == (0, 0)
+    assert [req[1] for req in client.sent] == (
+        [(param_str,) for param_str in save_param_strs] +
+        [(param_str, 2) for param_str in save_param_strs])
+
+
+def test_get_and_set_param_list_get_fails(save_params, save_param_strs):
+    logger.info("Validating nothing is set if getting a value fails.")
+    client = StubClient({save_param_strs[0]: 0,
+                         save_param_strs[1]: params.NAN_STR})
+
+    with pytest.raises(mparams.ParameterError):
+        params.get_and_set_param_list(client, save_params, (2, 2))
+
+    assert all(method not in (params.AsylumMethod.SET_VALUE,
+                              params.AsylumMethod.SET_STRING)
+               for method, __ in client.sent)
@@ -19,6 +19,11 @@ def igor_path():
     return "C:Users:nsulmol:data:test"
 
 
+@pytest.mark.parametrize("igor_path, python_path", [
+    ("C:Users:nsulmol:data:test", "C:/Users/nsulmol/data/test"),
+    ("C:", "C:/"),
+    ("test", "test"),  # No separators, returned as-is
+])
 def test_igor_to_python_path_logic(python_path, igor_path):
     logger.info("Validating igor-to-python path conversion works.")
     conv_python_path = xop.convert_igor_path_to_python_path(igor_path)
@@ -94,3 +99,18 @@ def test_parse_response_string(sample_response_str, exp_err_code,
     tmp_str = sample_response_str.replace("variable", "wave")
     with pytest.raises(xop.XOPUnsupportedTypeError):
         xop.parse_response_string(tmp_str)
+
+
+@pytest.fixture
+def sample_no_result_response_str():
+    return '{"errorCode": {"value": 0}, "messageID": "2"}'
+
+
+def test_parse_response_string_no_result(sample_no_result_response_str,
+                                         exp_err_code):
+    res_err_code, res_msg_id, res_param = xop.parse_response_string(
+        sample_no_result_response_str)
+
+    assert res_err_code == exp_err_code
+    assert res_msg_id == "2"
+    assert res_param is None
@@ -0,0 +1,51 @@
+"""Tests to validate the ImageTranslator creates scans properly."""
+
+import pytest
+import logging
+import numpy as np
+
+from afspm.components.microscope.translators.image.translator import (
+    ImageTranslator)
+from afspm.io.protos.generated import scan_pb2
+
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def translator():
+    return ImageTranslator(physical_origin=(0, 0),
+                           physical_size=(100, 100),
+                           physical_units='nm', data_units='nm',
+                           scan_time_s=0, move_time_s=0,
+                           name='image_translator', publisher=None,
+                           control_server=None)
+
+
+@pytest.mark.parametrize("top_left, size, shape", [
+    ((0, 0), (100, 100), (128, 128)),  # Full image
+    ((90, 90), (30, 30), (128, 128)),  # Overlapping image edges
+    ((-10, 50), (60, 60), (256, 200)),  # Overlapping, non-square
+])
+def test_update_scan_matches_interp(translator, top_left, size, shape):
+    logger.info("Validating update_scan() matches interpolating dev_img.")
+    scan_params = scan_pb2.ScanParameters2d()
+    scan_params.spatial.roi.top_left.x = top_left[0]
+    scan_params.spatial.roi.top_left.y = top_left[1]
+    scan_params.spatial.roi.size.x = size[0]
+    scan_params.spatial.roi.size.y = size[1]
+    scan_params.spatial.units = 'nm'
+    scan_params.data.shape.x = shape[0]
+    scan_params.data.shape.y = shape[1]
+
+    translator.dev_scan_params = scan_params
+    translator.update_scan()
+
+    x = np.linspace(top_left[0], top_left[0] + size[0], shape[0])
+    y = np.linspace(top_left[1], top_left[1] + size[1], shape[1])
+    expected = translator.dev_img.interp(x=x, y=y).values
+    vals = np.array(translator.dev_scan.values).reshape(expected.shape)
+
+    # Same NaNs (outside of the image), same values elsewhere.
+    assert np.array_equal(np.isnan(vals), np.isnan(expected))
+    assert np.allclose(vals, expected, equal_nan=True, rtol=0, atol=1e-9)